@@ -2,13 +2,76 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import replace
+import queue
+import threading
 import tkinter as tk
 from tkinter import messagebox, ttk
+from typing import Dict, Optional, Tuple
 
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+from supply_chain_simulation import SCENARIO_IDS, SimulationConfig, SimulationResults, iter_scenario_results
 
-from supply_chain_simulation import SimulationConfig, run_all_scenarios
+
+def _load_matplotlib():
+    # matplotlib (and numpy with it) dominates start-up time, so it is only
+    # imported once plots are needed; __init__ warms it on a background thread.
+    from matplotlib import style
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.figure import Figure
+
+    # Long horizons produce lines with thousands of vertices. The "fast" style
+    # lets Agg stroke them in chunks (agg.path.chunksize) and merges vertices
+    # closer than a pixel (path.simplify_threshold=1.0).
+    style.use("fast")
+    return Figure, FigureCanvasTkAgg
+
+
+def _is_int_text(text: str) -> bool:
+    return text == "" or text.isdigit()
+
+
+def _is_float_text(text: str) -> bool:
+    if text in ("", "."):
+        return True
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+# How often the Tk thread drains worker events, in milliseconds.
+PROGRESS_POLL_MS = 50
+
+# Each cached run holds five full sets of daily series; keep the most recent few.
+RESULT_CACHE_SIZE = 16
+
+# Formats a row's five metric columns in one call.
+_ROW_FORMAT = "{0:.2f}|{1:.2f}|{2:.2f}|{3:.2f}|{4:.2f}".format
+
+# Scenarios drawn in the plot tabs, with their legend labels.
+PLOTTED_SCENARIOS: Dict[int, str] = {1: "Baseline", 5: "Full vis"}
+
+# Daily series longer than this are decimated before plotting; the canvases are
+# well under 1000 px wide, so more vertices than this cannot show up on screen.
+MAX_PLOT_POINTS = 2000
+
+
+def _decimate(values):
+    # Min/max decimation: each bucket of days keeps its lowest and highest value,
+    # so peaks and troughs survive while the vertex count stays bounded.
+    import numpy as np
+
+    y = np.asarray(values)
+    n = len(y)
+    if n <= MAX_PLOT_POINTS:
+        return np.arange(n), y
+    stride = -(-n // (MAX_PLOT_POINTS // 2))
+    starts = np.arange(0, n, stride)
+    low = np.minimum.reduceat(y, starts)
+    high = np.maximum.reduceat(y, starts)
+    return np.repeat(starts, 2), np.column_stack((low, high)).ravel()
 
 
 class SupplyChainGUI:
@@ -17,7 +80,14 @@ class SupplyChainGUI:
         self.root.title("3-Stage Supply Chain SCV Simulation")
         self.root.geometry("1200x760")
         self.results = None
+        self.config = SimulationConfig()
+        self._result_cache: "OrderedDict[Tuple, Dict[int, SimulationResults]]" = OrderedDict()
+        self._running_key: Optional[Tuple] = None
+        self.lead_fig = None
+        self._events: "queue.Queue[tuple]" = queue.Queue()
+        self._pending_run: Optional[str] = None
         self._build_ui()
+        threading.Thread(target=_load_matplotlib, daemon=True).start()
 
     def _build_ui(self) -> None:
         main = ttk.Frame(self.root, padding=10)
@@ -33,21 +103,25 @@ class SupplyChainGUI:
         self.t1_cap_var = tk.IntVar(value=140)
         self.t23_cap_var = tk.IntVar(value=130)
 
+        # Reject non-numeric keystrokes so the Tk variables always parse in _run.
+        vcmd_int = (self.root.register(_is_int_text), "%P")
+        vcmd_float = (self.root.register(_is_float_text), "%P")
         rows = [
-            ("Horizon (days)", self.horizon_var),
-            ("Random seed", self.seed_var),
-            ("Expected daily demand", self.demand_var),
-            ("T1 capacity/day", self.t1_cap_var),
-            ("T23 capacity/day", self.t23_cap_var),
+            ("Horizon (days)", self.horizon_var, vcmd_int),
+            ("Random seed", self.seed_var, vcmd_int),
+            ("Expected daily demand", self.demand_var, vcmd_float),
+            ("T1 capacity/day", self.t1_cap_var, vcmd_int),
+            ("T23 capacity/day", self.t23_cap_var, vcmd_int),
         ]
-        for idx, (label, var) in enumerate(rows):
+        for idx, (label, var, vcmd) in enumerate(rows):
             ttk.Label(controls, text=label).grid(row=idx, column=0, sticky=tk.W, pady=4)
-            ttk.Entry(controls, textvariable=var, width=12).grid(row=idx, column=1, sticky=tk.W, pady=4)
+            ttk.Entry(controls, textvariable=var, width=12, validate="key", validatecommand=vcmd).grid(row=idx, column=1, sticky=tk.W, pady=4)
 
         ttk.Label(controls, text="Demand dist").grid(row=5, column=0, sticky=tk.W, pady=4)
         ttk.Combobox(controls, textvariable=self.dist_var, values=["poisson", "normal", "deterministic"], width=10, state="readonly").grid(row=5, column=1, sticky=tk.W, pady=4)
 
-        ttk.Button(controls, text="Run all 5 scenarios", command=self._run).grid(row=6, column=0, columnspan=2, pady=10)
+        self.run_button = ttk.Button(controls, text="Run all 5 scenarios", command=self._run)
+        self.run_button.grid(row=6, column=0, columnspan=2, pady=10)
         self.status = ttk.Label(controls, text="")
         self.status.grid(row=7, column=0, columnspan=2, sticky=tk.W)
 
@@ -64,7 +138,7 @@ class SupplyChainGUI:
             ("bullwhip", "Bullwhip", 90),
         ]:
             self.tree.heading(key, text=title)
-            self.tree.column(key, width=width)
+            self.tree.column(key, width=width, stretch=False)
         self.tree.pack(fill=tk.X, pady=(0, 8))
 
         self.notebook = ttk.Notebook(right)
@@ -73,88 +147,277 @@ class SupplyChainGUI:
         self.flow_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.fig_frame, text="Lead Time + Backlog")
         self.notebook.add(self.flow_frame, text="Orders + Demand")
+        # Tabs whose figure has new data but has not been drawn yet. Only the
+        # visible tab is drawn; the others catch up when they are selected.
+        self._stale_tabs = set()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+    def _read_config(self) -> SimulationConfig:
+        # Snapshot every Tk variable once, up front, before any work starts.
+        horizon = self.horizon_var.get()
+        seed = self.seed_var.get()
+        demand_type = self.dist_var.get()
+        demand = self.demand_var.get()
+        t1_capacity = self.t1_cap_var.get()
+        t23_capacity = self.t23_cap_var.get()
+
+        demand_params = {
+            "poisson": {"lambda": demand},
+            "normal": {"mean": demand, "std_dev": 20.0},
+            "deterministic": {"value": demand},
+        }[demand_type]
+        # SimulationConfig is frozen; derive each run's config from the last one.
+        config = replace(
+            self.config,
+            simulation_horizon=horizon,
+            random_seed=seed,
+            demand_distribution_type=demand_type,
+            demand_params=demand_params,
+            t1_daily_capacity=t1_capacity,
+            t23_daily_capacity=t23_capacity,
+        )
+        config.validate()
+        return config
 
     def _run(self) -> None:
+        # Rapid clicks collapse into one run, started once Tk is idle.
+        if self._pending_run is not None:
+            self.root.after_cancel(self._pending_run)
+        self._pending_run = self.root.after_idle(self._start_run)
+
+    def _start_run(self) -> None:
+        self._pending_run = None
         try:
-            demand_type = self.dist_var.get()
-            demand_params = {
-                "poisson": {"lambda": self.demand_var.get()},
-                "normal": {"mean": self.demand_var.get(), "std_dev": 20.0},
-                "deterministic": {"value": self.demand_var.get()},
-            }[demand_type]
-
-            config = SimulationConfig(
-                simulation_horizon=self.horizon_var.get(),
-                random_seed=self.seed_var.get(),
-                demand_distribution_type=demand_type,
-                demand_params=demand_params,
-                t1_daily_capacity=self.t1_cap_var.get(),
-                t23_daily_capacity=self.t23_cap_var.get(),
-            )
-
-            self.status.config(text="Running...")
-            self.root.update_idletasks()
-            self.results = run_all_scenarios(config)
-            self._populate_table()
-            self._plot()
-            self.status.config(text="Done")
+            config = self._read_config()
         except Exception as exc:
             messagebox.showerror("Simulation error", str(exc))
             self.status.config(text="Failed")
+            return
+        self.config = config
+
+        key = config.cache_key()
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            self.results = dict(cached)
+            for scenario_id, result in cached.items():
+                self._set_row(scenario_id, result)
+                self._plot_scenario(scenario_id, result)
+            self.status.config(text="Done (cached)")
+            return
+
+        self.results = {}
+        # Tabs marked stale by the previous run would otherwise redraw from the
+        # now-empty results.
+        self._stale_tabs.clear()
+        self.tree.delete(*self.tree.get_children())
+        self._running_key = key
+        self.run_button.state(["disabled"])
+        self.status.config(text="Running...")
+        threading.Thread(target=self._worker, args=(config,), daemon=True).start()
+        self.root.after(PROGRESS_POLL_MS, self._pump_progress)
+
+    def _worker(self, config: SimulationConfig) -> None:
+        # Runs off the Tk thread and never touches widgets; it only posts events
+        # that _pump_progress drains on the Tk thread. Scenarios run serially:
+        # at GUI horizons they finish faster than a process pool starts, and
+        # forking from this threaded Tk process is unsafe.
+        try:
+            for scenario_id, result in iter_scenario_results(config):
+                self._events.put(("result", scenario_id, result))
+        except Exception as exc:
+            self._events.put(("failed", exc))
+        else:
+            self._events.put(("finished",))
+
+    def _pump_progress(self) -> None:
+        while True:
+            try:
+                event = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] == "result":
+                self._on_scenario_done(event[1], event[2])
+            elif event[0] == "failed":
+                self._on_run_failed(event[1])
+                return
+            else:
+                self._on_run_finished()
+                return
+        self.root.after(PROGRESS_POLL_MS, self._pump_progress)
+
+    def _on_scenario_done(self, scenario_id: int, result) -> None:
+        self.results[scenario_id] = result
+        self._set_row(scenario_id, result)
+        self._plot_scenario(scenario_id, result)
+        self.status.config(text=f"Running... {len(self.results)}/{len(SCENARIO_IDS)} done")
+
+    def _on_run_finished(self) -> None:
+        # Stored in scenario order so cache hits can be replayed without sorting.
+        self._result_cache[self._running_key] = {scenario_id: self.results[scenario_id] for scenario_id in SCENARIO_IDS}
+        if len(self._result_cache) > RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+        self.status.config(text="Done")
+        self.run_button.state(["!disabled"])
+
+    def _on_run_failed(self, exc: Exception) -> None:
+        messagebox.showerror("Simulation error", str(exc))
+        self.status.config(text="Failed")
+        self.run_button.state(["!disabled"])
+
+    def _set_row(self, scenario_id: int, r) -> None:
+        iid = str(scenario_id)
+        cells = _ROW_FORMAT(r.mean_lead_time, r.worst_case_lead_time_p95, r.lead_time_std, r.mean_backlog_t1, r.bullwhip_ratio).split("|")
+        if cells[-1] == "nan":
+            cells[-1] = "NaN"
+        values = (r.scenario_name, *cells)
+        if self.tree.exists(iid):
+            self.tree.item(iid, values=values)
+            return
+        # Results arrive in completion order; keep the table sorted by scenario id.
+        position = sum(1 for other in self.results if other < scenario_id)
+        self.tree.insert("", position, iid=iid, values=values)
+
+    def _build_plots(self) -> None:
+        # Built on the first result. Figures, canvases and artists live for the
+        # whole session; each result only swaps the data of its own artists.
+        Figure, FigureCanvasTkAgg = _load_matplotlib()
+        self.lead_fig = Figure(figsize=(9, 4), layout="constrained")
+        self.lead_canvas = FigureCanvasTkAgg(self.lead_fig, self.fig_frame)
+        self.lead_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.hist_ax, self.backlog_ax = self.lead_fig.subplots(1, 2)
+        self.hist_ax.set_title("Lead-time distribution")
+        self._hist_bars = {}
+        self.backlog_ax.set_title("T1 backlog trend")
+        self._backlog_lines = {
+            scenario_id: self.backlog_ax.plot([], [], label=label)[0]
+            for scenario_id, label in PLOTTED_SCENARIOS.items()
+        }
+        self.backlog_ax.legend()
+
+        self.flow_fig = Figure(figsize=(9, 4), layout="constrained")
+        self.flow_canvas = FigureCanvasTkAgg(self.flow_fig, self.flow_frame)
+        self.flow_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.flow_ax = self.flow_fig.add_subplot(111)
+        self.flow_ax.set_title("Baseline demand vs upstream orders")
+        # Animated lines, blitted over a cached background of the static axes.
+        (self._demand_line,) = self.flow_ax.plot([], [], label="OEM demand", alpha=0.8, animated=True)
+        (self._orders_line,) = self.flow_ax.plot([], [], label="T1->T23 orders", alpha=0.8, animated=True)
+        self.flow_ax.legend()
+        self._flow_bg = None
+        self._flow_horizon = 0
+        self.flow_canvas.mpl_connect("draw_event", self._on_flow_draw)
+
+    def _plot_scenario(self, scenario_id: int, result: SimulationResults) -> None:
+        if scenario_id not in PLOTTED_SCENARIOS:
+            return
+        if self.lead_fig is None:
+            self._build_plots()
+
+        self._stale_tabs.add(str(self.fig_frame))
+        if scenario_id == 1:
+            self._stale_tabs.add(str(self.flow_frame))
+        self._refresh_visible_tab()
+
+    def _on_tab_changed(self, event) -> None:
+        self._refresh_visible_tab()
+
+    def _refresh_visible_tab(self) -> None:
+        tab = self.notebook.select()
+        if tab not in self._stale_tabs:
+            return
+        if tab == str(self.fig_frame):
+            if any(scenario_id in self.results for scenario_id in PLOTTED_SCENARIOS):
+                self._stale_tabs.discard(tab)
+                self._plot_lead_tab()
+        elif 1 in self.results:
+            self._stale_tabs.discard(tab)
+            self._plot_flow(self.results[1])
+
+    def _plot_lead_tab(self) -> None:
+        self._plot_lead_time_hist()
+        for scenario_id, line in self._backlog_lines.items():
+            if scenario_id in self.results:
+                line.set_data(*_decimate(self.results[scenario_id].t1_backlog_units))
+        self.backlog_ax.relim()
+        self.backlog_ax.autoscale_view()
+        self.lead_canvas.draw_idle()
+
+    def _plot_flow(self, result: SimulationResults) -> None:
+        demand = result.daily_oem_demand
+        orders = result.t1_to_t23_orders
+        same_horizon = len(demand) == self._flow_horizon
+        self._flow_horizon = len(demand)
+        self._demand_line.set_data(*_decimate(demand))
+        self._orders_line.set_data(*_decimate(orders))
+
+        y_low, y_high = self.flow_ax.get_ylim()
+        fits_view = y_low <= min(min(demand), min(orders)) and max(max(demand), max(orders)) <= y_high
+        if self._flow_bg is not None and same_horizon and fits_view:
+            self.flow_canvas.restore_region(self._flow_bg)
+            self._blit_flow_lines()
+        else:
+            # Limits change: a full redraw refreshes the background via draw_event.
+            self.flow_ax.relim()
+            self.flow_ax.autoscale_view()
+            self.flow_canvas.draw_idle()
+
+    def _on_flow_draw(self, event) -> None:
+        self._flow_bg = self.flow_canvas.copy_from_bbox(self.flow_ax.bbox)
+        self._blit_flow_lines()
+
+    def _blit_flow_lines(self) -> None:
+        self.flow_ax.draw_artist(self._demand_line)
+        self.flow_ax.draw_artist(self._orders_line)
+        self.flow_canvas.blit(self.flow_ax.bbox)
+
+    def _plot_lead_time_hist(self) -> None:
+        import numpy as np
 
-    def _populate_table(self) -> None:
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-        for scenario_id in [1, 2, 3, 4, 5]:
-            r = self.results[scenario_id]
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    r.scenario_name,
-                    f"{r.mean_lead_time:.2f}",
-                    f"{r.worst_case_lead_time_p95:.2f}",
-                    f"{r.lead_time_std:.2f}",
-                    f"{r.mean_backlog_t1:.2f}",
-                    "NaN" if str(r.bullwhip_ratio) == "nan" else f"{r.bullwhip_ratio:.2f}",
-                ),
-            )
-
-    def _plot(self) -> None:
-        for frame in [self.fig_frame, self.flow_frame]:
-            for child in frame.winfo_children():
-                child.destroy()
-
-        baseline = self.results[1]
-        full = self.results[5]
-
-        fig1 = Figure(figsize=(9, 4))
-        ax1 = fig1.add_subplot(121)
-        ax1.hist(baseline.lead_times, bins=20, alpha=0.6, label="Baseline")
-        ax1.hist(full.lead_times, bins=20, alpha=0.6, label="Full vis")
-        ax1.set_title("Lead-time distribution")
-        ax1.legend()
-
-        ax2 = fig1.add_subplot(122)
-        ax2.plot(baseline.t1_backlog_units, label="Baseline")
-        ax2.plot(full.t1_backlog_units, label="Full vis")
-        ax2.set_title("T1 backlog trend")
-        ax2.legend()
-        fig1.tight_layout()
-        c1 = FigureCanvasTkAgg(fig1, self.fig_frame)
-        c1.draw()
-        c1.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-        fig2 = Figure(figsize=(9, 4))
-        ax3 = fig2.add_subplot(111)
-        ax3.plot(baseline.daily_oem_demand, label="OEM demand", alpha=0.8)
-        ax3.plot(baseline.t1_to_t23_orders, label="T1->T23 orders", alpha=0.8)
-        ax3.set_title("Baseline demand vs upstream orders")
-        ax3.legend()
-        fig2.tight_layout()
-        c2 = FigureCanvasTkAgg(fig2, self.flow_frame)
-        c2.draw()
-        c2.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        ax = self.hist_ax
+        series = {
+            scenario_id: np.asarray(self.results[scenario_id].lead_times, dtype=np.int64)
+            for scenario_id in PLOTTED_SCENARIOS
+            if scenario_id in self.results
+        }
+        if not series:
+            return
+        # All scenarios share one set of bin edges.
+        edges = np.histogram_bin_edges(np.concatenate(list(series.values())), bins=20)
+        lefts, widths = edges[:-1], np.diff(edges)
+        legend_stale = False
+        for scenario_id, label in PLOTTED_SCENARIOS.items():
+            bars = self._hist_bars.get(scenario_id)
+            if scenario_id in series:
+                counts, _ = np.histogram(series[scenario_id], bins=edges)
+            elif bars is None:
+                continue
+            else:
+                # Not in this run (yet): flatten the bars but keep the container,
+                # so the scenario keeps its colour and legend entry.
+                counts = np.zeros(len(lefts), dtype=np.int64)
+            if bars is None:
+                # Colour matched to the scenario's backlog line so both legends agree.
+                self._hist_bars[scenario_id] = ax.bar(
+                    lefts,
+                    counts,
+                    width=widths,
+                    align="edge",
+                    alpha=0.6,
+                    color=self._backlog_lines[scenario_id].get_color(),
+                    label=label,
+                )
+                legend_stale = True
+                continue
+            # The bin count is fixed, so the existing rectangles are reused.
+            for rect, left, width, height in zip(bars, lefts, widths, counts):
+                rect.set_x(left)
+                rect.set_width(width)
+                rect.set_height(height)
+        if legend_stale:
+            ax.legend()
+        ax.relim()
+        ax.autoscale_view()
 
 
 def main() -> None:
@@ -1,10 +1,26 @@
 """Simple GUI for baseline vs forecast-sharing (Scenario 2)."""
 
+from dataclasses import replace
+from operator import attrgetter
+import queue
+import threading
 import tkinter as tk
 from tkinter import messagebox, ttk
 
 from supply_chain_simulation import SimulationConfig, compare_scenarios
 
+# How often the Tk thread checks for the worker's result, in milliseconds.
+RESULT_POLL_MS = 50
+
+# Table rows: label and the SimulationResults field shown for each scenario.
+METRIC_ROWS = (
+    ("Mean LT", "mean_lead_time"),
+    ("P95 LT", "worst_case_lead_time_p95"),
+    ("Mean Backlog T1", "mean_backlog_t1"),
+    ("Bullwhip", "bullwhip_ratio"),
+)
+_read_metrics = attrgetter(*(field for _, field in METRIC_ROWS))
+
 
 class ForecastSharingGUI:
     def __init__(self, root: tk.Tk) -> None:
@@ -14,6 +30,14 @@ class ForecastSharingGUI:
         self.days_var = tk.IntVar(value=180)
         self.seed_var = tk.IntVar(value=7)
         self.demand_var = tk.DoubleVar(value=100.0)
+        self._vars = (self.days_var, self.seed_var, self.demand_var)
+        # Poisson template; each run only overrides the fields the form edits.
+        self._base_config = SimulationConfig(demand_distribution_type="poisson")
+        # Inputs of the comparison currently on screen; re-running them is skipped.
+        self._last_params = None
+        self._pending_params = None
+        self._outcome: "queue.Queue[tuple]" = queue.Queue()
+        self._pending_run = None
         self._build()
 
     def _build(self) -> None:
@@ -26,39 +50,79 @@ class ForecastSharingGUI:
         ttk.Entry(frm, textvariable=self.seed_var, width=8).grid(row=0, column=3, padx=5)
         ttk.Label(frm, text="Poisson λ").grid(row=0, column=4, sticky=tk.W)
         ttk.Entry(frm, textvariable=self.demand_var, width=8).grid(row=0, column=5, padx=5)
-        ttk.Button(frm, text="Run", command=self._run).grid(row=0, column=6, padx=8)
+        self.run_button = ttk.Button(frm, text="Run", command=self._run)
+        self.run_button.grid(row=0, column=6, padx=8)
+        self.progress = ttk.Progressbar(frm, mode="indeterminate", length=120)
+        self.progress.grid(row=0, column=7, padx=5)
 
         self.tree = ttk.Treeview(frm, columns=("metric", "baseline", "forecast"), show="headings")
         for key, title, width in [("metric", "Metric", 220), ("baseline", "Baseline", 140), ("forecast", "Forecast", 140)]:
             self.tree.heading(key, text=title)
-            self.tree.column(key, width=width)
-        self.tree.grid(row=1, column=0, columnspan=7, sticky="nsew", pady=10)
+            self.tree.column(key, width=width, stretch=False)
+        self.tree.grid(row=1, column=0, columnspan=8, sticky="nsew", pady=10)
         frm.rowconfigure(1, weight=1)
+        self.status = ttk.Label(frm, text="Ready")
+        self.status.grid(row=2, column=0, columnspan=8, sticky=tk.W)
 
     def _run(self) -> None:
+        # Rapid clicks collapse into one run, started once Tk is idle.
+        if self._pending_run is not None:
+            self.root.after_cancel(self._pending_run)
+        self._pending_run = self.root.after_idle(self._start_run)
+
+    def _start_run(self) -> None:
+        self._pending_run = None
         try:
-            config = SimulationConfig(
-                simulation_horizon=self.days_var.get(),
-                random_seed=self.seed_var.get(),
-                demand_distribution_type="poisson",
-                demand_params={"lambda": self.demand_var.get()},
-            )
-            comparison = compare_scenarios(config)
-            self._render(comparison)
+            params = tuple(var.get() for var in self._vars)
+            if params == self._last_params:
+                self.status.config(text="Unchanged – showing previous results")
+                return
+            days, seed, demand = params
+            config = replace(self._base_config, simulation_horizon=days, random_seed=seed, demand_params={"lambda": demand})
+            config.validate()
         except Exception as exc:
             messagebox.showerror("Error", str(exc))
+            self.status.config(text="Failed")
+            return
+        self._pending_params = params
+        self.status.config(text="Running...")
+        self.run_button.state(["disabled"])
+        self.progress.start()
+        threading.Thread(target=self._worker, args=(config,), daemon=True).start()
+        self.root.after(RESULT_POLL_MS, self._poll_result)
+
+    def _worker(self, config: SimulationConfig) -> None:
+        # Runs off the Tk thread; the outcome is handed back through a queue.
+        try:
+            self._outcome.put(("done", compare_scenarios(config)))
+        except Exception as exc:
+            self._outcome.put(("failed", exc))
+
+    def _poll_result(self) -> None:
+        try:
+            status, payload = self._outcome.get_nowait()
+        except queue.Empty:
+            self.root.after(RESULT_POLL_MS, self._poll_result)
+            return
+        self.progress.stop()
+        self.run_button.state(["!disabled"])
+        if status == "done":
+            self._last_params = self._pending_params
+            self._render(payload)
+            self.status.config(text="Done")
+        else:
+            self.status.config(text="Failed")
+            messagebox.showerror("Error", str(payload))
 
     def _render(self, cmp) -> None:
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-        rows = [
-            ("Mean LT", cmp.baseline.mean_lead_time, cmp.forecast_sharing.mean_lead_time),
-            ("P95 LT", cmp.baseline.worst_case_lead_time_p95, cmp.forecast_sharing.worst_case_lead_time_p95),
-            ("Mean Backlog T1", cmp.baseline.mean_backlog_t1, cmp.forecast_sharing.mean_backlog_t1),
-            ("Bullwhip", cmp.baseline.bullwhip_ratio, cmp.forecast_sharing.bullwhip_ratio),
-        ]
-        for metric, b, f in rows:
-            self.tree.insert("", tk.END, values=(metric, f"{b:.2f}", f"{f:.2f}"))
+        # Rows are keyed by field name and updated in place once inserted.
+        rows = zip(METRIC_ROWS, _read_metrics(cmp.baseline), _read_metrics(cmp.forecast_sharing))
+        for (metric, field), b, f in rows:
+            values = (metric, f"{b:.2f}", f"{f:.2f}")
+            if self.tree.exists(field):
+                self.tree.item(field, values=values)
+            else:
+                self.tree.insert("", tk.END, iid=field, values=values)
 
 
 if __name__ == "__main__":
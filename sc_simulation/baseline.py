@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 import math
 import random
-from typing import List
+from typing import Deque, Dict, List
+
+from supply_chain_simulation import poisson_variate
 
 
 @dataclass(frozen=True)
@@ -37,126 +40,129 @@ class BaselineResults:
     lead_times: List[float]
 
 
-def _poisson(rng: random.Random, lam: float) -> int:
-    if lam <= 0:
-        return 0
-    l = math.exp(-lam)
-    k = 0
-    p = 1.0
-    while p > l:
-        k += 1
-        p *= rng.random()
-    return k - 1
-
-
 def simulate_baseline(params: BaselineParams = BaselineParams()) -> BaselineResults:
     rng = random.Random(params.seed)
 
     t1_inventory = params.t1_initial_inventory
     oem_inventory = params.oem_initial_inventory
 
-    t1_shipments = []
-    t2_shipments = []
+    # In-transit quantities keyed by arrival day.
+    t1_arrivals: Dict[int, int] = {}
+    t2_arrivals: Dict[int, int] = {}
+    # Running totals of open OEM order quantity and of T2->T1 goods in transit.
+    t1_backlog_qty = 0
+    t2_in_transit = 0
 
-    oem_orders = []
+    # Open OEM orders as [order_day, remaining] pairs, oldest first; T1 fills
+    # them strictly in arrival order.
+    oem_orders: Deque[List[int]] = deque()
     t2_backlog = 0
 
     lead_times: List[float] = []
     on_time_shipments = 0
     total_shipments = 0
+    lt_sum = 0
+    lt_sq_sum = 0
+    lt_max = 0
 
-    daily_wip = []
-    daily_backlog = []
+    # Only the averages are reported, so the daily levels are summed as they go.
+    wip_total = 0
+    backlog_total = 0
 
     t1_rop = int(params.t1_rop_days * params.avg_daily_demand)
     t1_order_up_to = int(params.t1_order_up_to_days * params.avg_daily_demand)
+    demand_lam = params.avg_daily_demand
+    order_cycle = params.oem_order_cycle_days
+    order_lam = demand_lam * order_cycle
+    t1_lt_base = params.t1_to_oem_lead_time_base
+    t1_lt_width = params.t1_to_oem_lead_time_uniform_max
+    t2_lt_base = params.t2_to_t1_lead_time_base
+    t2_lt_rate = 1 / params.t2_to_t1_lead_time_exp_mean
+    otif_target = params.otif_target_days
+    downtime_probability = params.t2_downtime_probability
+    capacity_mean = params.t2_daily_mean_capacity
+    capacity_sd = params.t2_daily_capacity_sd
+    rng_random = rng.random
+    rng_gauss = rng.gauss
 
     for day in range(params.days):
         # Process arrivals to OEM
-        arrived_shipments = [s for s in t1_shipments if s["arrival_day"] <= day]
-        t1_shipments = [s for s in t1_shipments if s["arrival_day"] > day]
-        for shipment in arrived_shipments:
-            oem_inventory += shipment["qty"]
+        oem_inventory += t1_arrivals.pop(day, 0)
 
         # Process arrivals to T1
-        arrived_t2 = [s for s in t2_shipments if s["arrival_day"] <= day]
-        t2_shipments = [s for s in t2_shipments if s["arrival_day"] > day]
-        for shipment in arrived_t2:
-            t1_inventory += shipment["qty"]
+        arrived_t2 = t2_arrivals.pop(day, 0)
+        t1_inventory += arrived_t2
+        t2_in_transit -= arrived_t2
 
         # OEM demand from customer
-        demand = _poisson(rng, params.avg_daily_demand)
+        demand = poisson_variate(rng, demand_lam)
         if demand <= oem_inventory:
             oem_inventory -= demand
         else:
             oem_inventory = 0
 
         # OEM places order to T1
-        if day % params.oem_order_cycle_days == 0:
-            order_size = _poisson(rng, params.avg_daily_demand * params.oem_order_cycle_days)
+        if day % order_cycle == 0:
+            order_size = poisson_variate(rng, order_lam)
             if order_size > 0:
-                oem_orders.append({"order_day": day, "remaining": order_size})
+                oem_orders.append([day, order_size])
+                t1_backlog_qty += order_size
 
         # T1 fulfills OEM orders
-        for order in oem_orders:
-            if order["remaining"] == 0 or t1_inventory == 0:
-                continue
-            qty = min(order["remaining"], t1_inventory)
+        while oem_orders and t1_inventory > 0:
+            order = oem_orders[0]
+            order_day, remaining = order
+            qty = min(remaining, t1_inventory)
             t1_inventory -= qty
-            order["remaining"] -= qty
-            lead_time = (
-                params.t1_to_oem_lead_time_base
-                + rng.uniform(0, params.t1_to_oem_lead_time_uniform_max)
-            )
-            arrival_day = day + math.ceil(lead_time)
-            t1_shipments.append(
-                {"arrival_day": arrival_day, "qty": qty, "order_day": order["order_day"]}
-            )
-            lt = arrival_day - order["order_day"]
+            order[1] = remaining - qty
+            t1_backlog_qty -= qty
+            # Same transform as rng.uniform(0, width), applied to one draw.
+            arrival_day = day + math.ceil(t1_lt_base + t1_lt_width * rng_random())
+            # Shipments are received from the next day on at the earliest.
+            bucket = max(arrival_day, day + 1)
+            t1_arrivals[bucket] = t1_arrivals.get(bucket, 0) + qty
+            lt = arrival_day - order_day
             lead_times.append(lt)
             total_shipments += 1
-            if lt <= params.otif_target_days:
+            lt_sum += lt
+            lt_sq_sum += lt * lt
+            if lt > lt_max:
+                lt_max = lt
+            if lt <= otif_target:
                 on_time_shipments += 1
-
-        oem_orders = [order for order in oem_orders if order["remaining"] > 0]
+            if qty == remaining:
+                oem_orders.popleft()
 
         # T1 inventory policy toward T2
-        t1_backlog_qty = sum(order["remaining"] for order in oem_orders)
-        t2_pipeline = sum(s["qty"] for s in t2_shipments)
+        t2_pipeline = t2_in_transit
         inventory_position = t1_inventory + t2_pipeline - t1_backlog_qty
         if inventory_position <= t1_rop:
             order_qty = max(0, t1_order_up_to - inventory_position)
             t2_backlog += order_qty
 
         # T2 production and shipment
-        if rng.random() < params.t2_downtime_probability:
+        if rng_random() < downtime_probability:
             daily_capacity = 0
         else:
-            daily_capacity = max(
-                0, int(round(rng.gauss(params.t2_daily_mean_capacity, params.t2_daily_capacity_sd)))
-            )
+            daily_capacity = max(0, round(rng_gauss(capacity_mean, capacity_sd)))
         produced = min(t2_backlog, daily_capacity)
         if produced > 0:
             t2_backlog -= produced
-            t2_lead_time = params.t2_to_t1_lead_time_base + rng.expovariate(
-                1 / params.t2_to_t1_lead_time_exp_mean
-            )
-            arrival_day = day + math.ceil(t2_lead_time)
-            t2_shipments.append({"arrival_day": arrival_day, "qty": produced})
-
-        daily_wip.append(t1_inventory + t2_pipeline)
-        daily_backlog.append(t1_backlog_qty)
-
-    mean_lt = sum(lead_times) / len(lead_times) if lead_times else 0.0
-    variance = (
-        sum((lt - mean_lt) ** 2 for lt in lead_times) / len(lead_times)
-        if lead_times
-        else 0.0
-    )
-    std_lt = math.sqrt(variance)
-    max_lt = max(lead_times) if lead_times else 0.0
-    avg_wip = sum(daily_wip) / len(daily_wip) if daily_wip else 0.0
-    avg_backlog = sum(daily_backlog) / len(daily_backlog) if daily_backlog else 0.0
+            # Same inversion as rng.expovariate(rate), applied to one draw.
+            t2_lead_days = math.ceil(t2_lt_base - math.log(1.0 - rng_random()) / t2_lt_rate)
+            arrival_day = max(day + t2_lead_days, day + 1)
+            t2_arrivals[arrival_day] = t2_arrivals.get(arrival_day, 0) + produced
+            t2_in_transit += produced
+
+        wip_total += t1_inventory + t2_pipeline
+        backlog_total += t1_backlog_qty
+
+    n = total_shipments
+    mean_lt = lt_sum / n if n else 0.0
+    std_lt = math.sqrt((n * lt_sq_sum - lt_sum * lt_sum) / (n * n)) if n else 0.0
+    max_lt = lt_max if n else 0.0
+    avg_wip = wip_total / params.days if params.days > 0 else 0.0
+    avg_backlog = backlog_total / params.days if params.days > 0 else 0.0
     otif = on_time_shipments / total_shipments if total_shipments else 0.0
 
     return BaselineResults(
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+import heapq
+from itertools import repeat
 import math
 import random
-from statistics import mean, pstdev
-from typing import Dict, List, Literal, Optional
+from typing import Deque, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
 
 DemandType = Literal["poisson", "normal", "deterministic"]
 
+SCENARIO_NAMES: Dict[int, str] = {
+    1: "baseline",
+    2: "forecast_sharing",
+    3: "inventory_visibility",
+    4: "capacity_visibility",
+    5: "full_visibility",
+}
+SCENARIO_IDS: Tuple[int, ...] = tuple(SCENARIO_NAMES)
+
 
 @dataclass(frozen=True)
 class SimulationConfig:
@@ -60,6 +74,13 @@ class SimulationConfig:
         else:
             raise ValueError("Unsupported demand_distribution_type")
 
+    def cache_key(self) -> Tuple:
+        """Hashable signature of every field, for memoizing simulation results."""
+        return tuple(
+            tuple(sorted(value.items())) if isinstance(value, dict) else value
+            for value in (getattr(self, f.name) for f in fields(self))
+        )
+
 
 @dataclass
 class OrderLogEntry:
@@ -101,67 +122,112 @@ class ScenarioComparison:
 
 
 def _round_nonnegative(value: float) -> int:
-    return max(0, int(round(value)))
+    return max(0, round(value))
 
 
 def _pop_variance(values: List[int]) -> float:
-    if not values:
+    # Inputs are whole units; the integer sums are exact.
+    n = len(values)
+    if not n:
         return 0.0
-    m = sum(values) / len(values)
-    return sum((v - m) ** 2 for v in values) / len(values)
+    total = sum(values)
+    return (n * sum(v * v for v in values) - total * total) / (n * n)
 
 
 def _percentile_inclusive(values: List[int], percentile: float) -> float:
     if not values:
         return 0.0
-    sorted_values = sorted(values)
-    if len(sorted_values) == 1:
-        return float(sorted_values[0])
-    pos = (len(sorted_values) - 1) * percentile
+    n = len(values)
+    if n == 1:
+        return float(values[0])
+    pos = (n - 1) * percentile
     low = int(math.floor(pos))
     high = int(math.ceil(pos))
+    # top[-1] and top[-2] are the order statistics at low and high.
+    top = heapq.nlargest(n - low, values)
     if low == high:
-        return float(sorted_values[low])
+        return float(top[-1])
     frac = pos - low
-    return sorted_values[low] + frac * (sorted_values[high] - sorted_values[low])
+    return top[-1] + frac * (top[-2] - top[-1])
 
 
-def _poisson(rng: random.Random, lam: float) -> int:
-    threshold = math.exp(-lam)
+# Above this mean exp(-lam) heads towards underflow, so larger means are drawn
+# as the sum of two independent halves.
+_POISSON_MAX_LAMBDA = 500.0
+
+
+@lru_cache(maxsize=16)
+def _poisson_cdf(lam: float) -> Tuple[float, ...]:
+    # Every CDF value the inversion walk can visit, from k = 0 until past the
+    # mode the sum stops growing in float precision. The last entry is then
+    # raised to at least 1.0, so every u in [0, 1) lands inside the table.
+    p = math.exp(-lam)
+    cdf = p
+    table = [cdf]
     k = 0
-    p = 1.0
-    while p > threshold:
+    while True:
         k += 1
-        p *= rng.random()
-    return k - 1
+        p *= lam / k
+        if cdf + p == cdf and k > lam:
+            break
+        cdf += p
+        table.append(cdf)
+    table[-1] = max(table[-1], 1.0)
+    return tuple(table)
+
+
+def poisson_variate(rng: random.Random, lam: float) -> int:
+    """Draw one Poisson(``lam``) variate from ``rng``; ``lam <= 0`` gives 0.
+
+    Shared by both simulation models. Inverse-CDF sampling with a single
+    uniform per draw: the smallest k whose cumulative probability reaches u.
+    """
+    if lam <= 0:
+        return 0
+    if lam > _POISSON_MAX_LAMBDA:
+        half = lam / 2
+        return poisson_variate(rng, half) + poisson_variate(rng, lam - half)
+    return bisect_left(_poisson_cdf(lam), rng.random())
+
+
+@lru_cache(maxsize=64)
+def _demand_series(seed: int, dist: str, params: Tuple[Tuple[str, float], ...], horizon: int) -> Tuple[int, ...]:
+    # Demand depends only on the seed and the demand settings, never on the
+    # scenario, so one draw is shared by all scenarios of a replication.
+    rng = random.Random(seed)
+    p = dict(params)
+    if dist == "poisson":
+        lam = p["lambda"]
+        return tuple(poisson_variate(rng, lam) for _ in range(horizon))
+    if dist == "normal":
+        gauss, mu, sigma = rng.gauss, p["mean"], p["std_dev"]
+        return tuple(max(0, round(gauss(mu, sigma))) for _ in range(horizon))
+    return (max(0, round(p["value"])),) * horizon
 
 
 def _scenario_name(scenario_id: int) -> str:
-    return {
-        1: "baseline",
-        2: "forecast_sharing",
-        3: "inventory_visibility",
-        4: "capacity_visibility",
-        5: "full_visibility",
-    }[scenario_id]
+    return SCENARIO_NAMES[scenario_id]
 
 
 class SupplyChainSimulation:
+    __slots__ = ("config", "scenario_id", "seed", "_next_order_id")
+
     def __init__(self, config: SimulationConfig, scenario_id: int = 1, seed_offset: int = 0):
         self.config = config
         self.config.validate()
         self.scenario_id = scenario_id
-        self.rng = random.Random(config.random_seed + seed_offset)
+        self.seed = config.random_seed + seed_offset
         self._next_order_id = 1
 
-    def _demand_sample(self) -> int:
-        dist = self.config.demand_distribution_type
-        p = self.config.demand_params
-        if dist == "poisson":
-            return _poisson(self.rng, p["lambda"])
-        if dist == "normal":
-            return max(0, int(round(self.rng.gauss(p["mean"], p["std_dev"]))))
-        return max(0, int(round(p["value"])))
+    @property
+    def rng(self) -> random.Random:
+        """A fresh generator at the start of this run's demand stream.
+
+        Demand is drawn once per seed and shared between scenarios, so the run
+        itself no longer draws from a per-instance generator; replacing this
+        one has no effect on results.
+        """
+        return random.Random(self.seed)
 
     def _expected_demand(self) -> float:
         if self.config.demand_distribution_type == "poisson":
@@ -170,160 +236,173 @@ class SupplyChainSimulation:
             return self.config.demand_params["mean"]
         return self.config.demand_params["value"]
 
-    def _forecast_sum(self, day: int) -> float:
-        horizon_remaining = max(0, self.config.simulation_horizon - (day + 1))
-        horizon = min(self.config.oem_forecast_horizon, horizon_remaining)
-        return self._expected_demand() * horizon
+    def _forecast_sums(self) -> List[float]:
+        # Shared forecast volume over the next oem_forecast_horizon days, for every day.
+        expected = self._expected_demand()
+        n = self.config.simulation_horizon
+        forecast_horizon = self.config.oem_forecast_horizon
+        return [expected * min(forecast_horizon, max(0, n - (day + 1))) for day in range(n)]
 
     def run_simulation(self) -> SimulationResults:
         c = self.config
         oem_on_hand = c.initial_oem_inventory
         t1_on_hand = c.initial_t1_inventory
 
+        # Order ids are consecutive, so an order's record is at
+        # order_id - first_order_id.
         oem_order_pipeline: List[Dict[str, Optional[int]]] = []
-        t1_backlog_queue: List[Dict[str, Optional[int]]] = []
-        t1_inbound_shipments: List[Dict[str, int]] = []
-        t1_outbound_shipments: List[Dict[str, int]] = []
-        t23_order_backlog_queue: List[Dict[str, int]] = []
-
-        daily_oem_demand: List[int] = []
-        oem_to_t1_orders: List[int] = []
-        t1_to_t23_orders: List[int] = []
-        t1_backlog_units: List[int] = []
-        t1_on_hand_ts: List[int] = []
-        t1_shipments_to_oem: List[int] = []
-        t23_backlog_units: List[int] = []
-        t23_production: List[int] = []
-        oem_on_hand_ts: List[int] = []
+        first_order_id = self._next_order_id
+        # Queue entries are plain (order_id, qty) tuples and T23 backlog entries are
+        # bare remaining quantities; nothing downstream reads any other field.
+        t1_backlog_queue: Deque[Tuple[int, int]] = deque()
+        t23_order_backlog_queue: Deque[int] = deque()
+        # Running totals of the queues above, kept in step with every append/pop
+        # so the daily inventory-position and metric reads are O(1).
+        open_pipeline_qty = 0
+        t1_backlog_qty = 0
+        t23_backlog_qty = 0
+        # In-transit goods bucketed by arrival day (transport delays are fixed).
+        t1_inbound_by_day = [0] * (c.simulation_horizon + c.transport_delay_t23_to_t1 + 1)
+        oem_inbound_by_day: List[List[Tuple[int, int]]] = [[] for _ in range(c.simulation_horizon + c.transport_delay_t1_to_oem + 1)]
+
+        daily_oem_demand = list(
+            _demand_series(self.seed, c.demand_distribution_type, tuple(sorted(c.demand_params.items())), c.simulation_horizon)
+        )
+        # Scenario switches are fixed for the whole run; resolve them once.
+        has_forecast_sharing = self.scenario_id in (2, 5)
+        has_inventory_visibility = self.scenario_id in (3, 5)
+        has_capacity_visibility = self.scenario_id in (4, 5)
+        forecast_sums = self._forecast_sums() if has_forecast_sharing else []
+        # One slot per day, filled by index; lead_times stays a list since its
+        # length depends on how many orders complete.
+        horizon = c.simulation_horizon
+        oem_to_t1_orders: List[int] = [0] * horizon
+        t1_to_t23_orders: List[int] = [0] * horizon
+        t1_backlog_units: List[int] = [0] * horizon
+        t1_on_hand_ts: List[int] = [0] * horizon
+        t1_shipments_to_oem: List[int] = [0] * horizon
+        t23_backlog_units: List[int] = [0] * horizon
+        t23_production: List[int] = [0] * horizon
+        oem_on_hand_ts: List[int] = [0] * horizon
         lead_times: List[int] = []
 
-        for day in range(c.simulation_horizon):
+        oem_order_up_to_S = c.oem_order_up_to_S
+        t1_order_up_to_S = c.t1_order_up_to_S
+        t1_daily_capacity = c.t1_daily_capacity
+        t23_daily_capacity = c.t23_daily_capacity
+        t23_capacity_cap = float(t23_daily_capacity)
+        delay_t1_to_oem = c.transport_delay_t1_to_oem
+        delay_t23_to_t1 = c.transport_delay_t23_to_t1
+        beta_f = c.beta_f
+        alpha_inv = c.alpha_inv
+        oem_target = c.oem_inventory_target if c.oem_inventory_target is not None else oem_order_up_to_S
+        next_order_id = self._next_order_id
+
+        for day in range(horizon):
             # 1) T1 receives inbound shipments from T23
-            arrivals_t1 = [s for s in t1_inbound_shipments if s["arrival_day"] == day]
-            t1_on_hand += sum(s["qty"] for s in arrivals_t1)
-            t1_inbound_shipments = [s for s in t1_inbound_shipments if s["arrival_day"] != day]
+            t1_on_hand += t1_inbound_by_day[day]
 
             # 2) OEM receives inbound shipments from T1
-            arrivals_oem = [s for s in t1_outbound_shipments if s["arrival_day"] == day]
-            for shipment in arrivals_oem:
-                oem_on_hand += shipment["qty"]
-                matching = next((o for o in oem_order_pipeline if o["order_id"] == shipment["order_id"] and o["day_received"] is None), None)
-                if matching is not None:
+            for order_id, qty in oem_inbound_by_day[day]:
+                oem_on_hand += qty
+                matching = oem_order_pipeline[order_id - first_order_id]
+                if matching["day_received"] is None:
                     matching["day_received"] = day
+                    open_pipeline_qty -= matching["qty"]
                     lead_times.append(day - int(matching["day_placed"]))
-            t1_outbound_shipments = [s for s in t1_outbound_shipments if s["arrival_day"] != day]
 
             # 3) OEM demand realization
-            demand = self._demand_sample()
-            daily_oem_demand.append(demand)
+            demand = daily_oem_demand[day]
             oem_on_hand = max(0, oem_on_hand - demand)
 
             # 4) OEM ordering decision
-            pipeline_qty = sum(int(o["qty"]) for o in oem_order_pipeline if o["day_received"] is None)
-            ip_oem = oem_on_hand + pipeline_qty
-            oem_order_qty = _round_nonnegative(max(0.0, c.oem_order_up_to_S - ip_oem))
-            oem_to_t1_orders.append(oem_order_qty)
+            ip_oem = oem_on_hand + open_pipeline_qty
+            oem_order_qty = _round_nonnegative(max(0.0, oem_order_up_to_S - ip_oem))
+            oem_to_t1_orders[day] = oem_order_qty
             if oem_order_qty > 0:
                 order = {
-                    "order_id": self._next_order_id,
+                    "order_id": next_order_id,
                     "qty": oem_order_qty,
                     "day_placed": day,
                     "day_shipped": None,
                     "day_received": None,
                 }
-                self._next_order_id += 1
                 oem_order_pipeline.append(order)
-                t1_backlog_queue.append(
-                    {
-                        "order_id": order["order_id"],
-                        "qty": order["qty"],
-                        "day_received_from_oem": day,
-                        "day_shipped": None,
-                    }
-                )
+                t1_backlog_queue.append((next_order_id, oem_order_qty))
+                next_order_id += 1
+                open_pipeline_qty += oem_order_qty
+                t1_backlog_qty += oem_order_qty
 
             # 5) T1 shipping to OEM
-            available_shipping_capacity = c.t1_daily_capacity
+            available_shipping_capacity = t1_daily_capacity
             shipped_today = 0
             while t1_backlog_queue:
-                oldest = t1_backlog_queue[0]
-                qty = int(oldest["qty"])
+                order_id, qty = t1_backlog_queue[0]
                 if t1_on_hand >= qty and available_shipping_capacity >= qty:
                     t1_on_hand -= qty
                     available_shipping_capacity -= qty
                     shipped_today += qty
-                    oldest["day_shipped"] = day
-                    matching = next(o for o in oem_order_pipeline if o["order_id"] == oldest["order_id"])
+                    matching = oem_order_pipeline[order_id - first_order_id]
                     matching["day_shipped"] = day
-                    t1_outbound_shipments.append(
-                        {
-                            "order_id": int(oldest["order_id"]),
-                            "qty": qty,
-                            "dispatch_day": day,
-                            "arrival_day": day + c.transport_delay_t1_to_oem,
-                        }
-                    )
-                    t1_backlog_queue.pop(0)
+                    oem_inbound_by_day[day + delay_t1_to_oem].append((order_id, qty))
+                    t1_backlog_queue.popleft()
+                    t1_backlog_qty -= qty
                 else:
                     break
 
-            backlog_qty_after_shipping = sum(int(o["qty"]) for o in t1_backlog_queue)
+            backlog_qty_after_shipping = t1_backlog_qty
 
             # 6) T1 upstream ordering
-            inbound_pipeline_qty = sum(s["qty"] for s in t1_inbound_shipments if s["arrival_day"] > day)
+            inbound_pipeline_qty = sum(t1_inbound_by_day[day + 1 : day + delay_t23_to_t1 + 1])
             ip_t1 = t1_on_hand + inbound_pipeline_qty - backlog_qty_after_shipping
-            s_t1_effective = c.t1_order_up_to_S
+            s_t1_effective = t1_order_up_to_S
 
-            if self.scenario_id in (2, 5):
-                s_t1_effective += c.beta_f * self._forecast_sum(day)
-            if self.scenario_id in (3, 5):
-                target = c.oem_inventory_target if c.oem_inventory_target is not None else c.oem_order_up_to_S
-                s_t1_effective = max(0.0, s_t1_effective - c.alpha_inv * (oem_on_hand - target))
+            if has_forecast_sharing:
+                s_t1_effective += beta_f * forecast_sums[day]
+            if has_inventory_visibility:
+                s_t1_effective = max(0.0, s_t1_effective - alpha_inv * (oem_on_hand - oem_target))
 
             t1_order_raw = max(0.0, s_t1_effective - ip_t1)
-            if self.scenario_id in (4, 5):
-                t1_order_raw = min(t1_order_raw, float(c.t23_daily_capacity))
+            if has_capacity_visibility:
+                t1_order_raw = min(t1_order_raw, t23_capacity_cap)
 
             t1_order_qty = _round_nonnegative(t1_order_raw)
-            t1_to_t23_orders.append(t1_order_qty)
+            t1_to_t23_orders[day] = t1_order_qty
             if t1_order_qty > 0:
-                t23_order_backlog_queue.append({"qty": t1_order_qty, "day_received_from_t1": day})
+                t23_order_backlog_queue.append(t1_order_qty)
+                t23_backlog_qty += t1_order_qty
 
             # 7) T23 production (FIFO, partial allowed)
-            available_capacity = c.t23_daily_capacity
+            available_capacity = t23_daily_capacity
             produced_today = 0
             while available_capacity > 0 and t23_order_backlog_queue:
-                oldest = t23_order_backlog_queue[0]
-                produce = min(available_capacity, oldest["qty"])
-                oldest["qty"] -= produce
+                produce = min(available_capacity, t23_order_backlog_queue[0])
+                t23_order_backlog_queue[0] -= produce
                 available_capacity -= produce
                 produced_today += produce
-                if oldest["qty"] == 0:
-                    t23_order_backlog_queue.pop(0)
+                t23_backlog_qty -= produce
+                if t23_order_backlog_queue[0] == 0:
+                    t23_order_backlog_queue.popleft()
 
             # 8) T23 dispatch to T1
-            if produced_today > 0:
-                t1_inbound_shipments.append(
-                    {
-                        "qty": produced_today,
-                        "dispatch_day": day,
-                        "arrival_day": day + c.transport_delay_t23_to_t1,
-                    }
-                )
+            t1_inbound_by_day[day + delay_t23_to_t1] += produced_today
 
             # 9) End-of-day metrics
-            t1_shipments_to_oem.append(shipped_today)
-            t1_backlog_units.append(backlog_qty_after_shipping)
-            t1_on_hand_ts.append(t1_on_hand)
-            t23_backlog_units.append(sum(o["qty"] for o in t23_order_backlog_queue))
-            t23_production.append(produced_today)
-            oem_on_hand_ts.append(oem_on_hand)
-
-        mean_backlog = mean(t1_backlog_units) if t1_backlog_units else 0.0
+            t1_shipments_to_oem[day] = shipped_today
+            t1_backlog_units[day] = backlog_qty_after_shipping
+            t1_on_hand_ts[day] = t1_on_hand
+            t23_backlog_units[day] = t23_backlog_qty
+            t23_production[day] = produced_today
+            oem_on_hand_ts[day] = oem_on_hand
+
+        self._next_order_id = next_order_id
+        # Series are integer unit counts: plain sum/len is exact and avoids the
+        # Fraction arithmetic statistics.mean uses on every element.
+        mean_backlog = sum(t1_backlog_units) / len(t1_backlog_units) if t1_backlog_units else 0.0
         demand_variance = _pop_variance(daily_oem_demand)
         order_variance = _pop_variance(t1_to_t23_orders)
         bullwhip = order_variance / demand_variance if demand_variance > 0 else float("nan")
-        mean_wip = mean([t1_on_hand_ts[i] + t23_backlog_units[i] for i in range(len(t1_on_hand_ts))]) if t1_on_hand_ts else 0.0
+        mean_wip = (sum(t1_on_hand_ts) + sum(t23_backlog_units)) / len(t1_on_hand_ts) if t1_on_hand_ts else 0.0
 
         order_log = [
             OrderLogEntry(
@@ -339,8 +418,8 @@ class SupplyChainSimulation:
         return SimulationResults(
             scenario_id=self.scenario_id,
             scenario_name=_scenario_name(self.scenario_id),
-            mean_lead_time=mean(lead_times) if lead_times else 0.0,
-            lead_time_std=pstdev(lead_times) if len(lead_times) > 1 else 0.0,
+            mean_lead_time=sum(lead_times) / len(lead_times) if lead_times else 0.0,
+            lead_time_std=math.sqrt(_pop_variance(lead_times)) if len(lead_times) > 1 else 0.0,
             worst_case_lead_time_p95=_percentile_inclusive(lead_times, 0.95),
             mean_backlog_t1=mean_backlog,
             max_backlog_t1=max(t1_backlog_units) if t1_backlog_units else 0,
@@ -361,7 +440,7 @@ class SupplyChainSimulation:
 
 
 def run_scenario(config: SimulationConfig, scenario_id: int) -> SimulationResults:
-    if scenario_id not in {1, 2, 3, 4, 5}:
+    if scenario_id not in SCENARIO_NAMES:
         raise ValueError("scenario_id must be in {1,2,3,4,5}")
 
     all_results = [SupplyChainSimulation(config, scenario_id, seed_offset=i).run_simulation() for i in range(config.replications_per_scenario)]
@@ -369,17 +448,21 @@ def run_scenario(config: SimulationConfig, scenario_id: int) -> SimulationResult
         return all_results[0]
 
     # Aggregate scalar KPIs across replications; keep timeseries from replication 0.
+    # One pass transposes the replications into per-KPI columns.
     base = all_results[0]
+    columns = zip(*((r.mean_lead_time, r.lead_time_std, r.worst_case_lead_time_p95, r.mean_backlog_t1, r.bullwhip_ratio, r.mean_wip, r.max_backlog_t1) for r in all_results))
+    n = len(all_results)
+    mean_lt, std_lt, p95_lt, mean_backlog, bullwhip, mean_wip, max_backlog = columns
     return SimulationResults(
         scenario_id=scenario_id,
         scenario_name=base.scenario_name,
-        mean_lead_time=mean(r.mean_lead_time for r in all_results),
-        lead_time_std=mean(r.lead_time_std for r in all_results),
-        worst_case_lead_time_p95=mean(r.worst_case_lead_time_p95 for r in all_results),
-        mean_backlog_t1=mean(r.mean_backlog_t1 for r in all_results),
-        max_backlog_t1=max(r.max_backlog_t1 for r in all_results),
-        bullwhip_ratio=mean(r.bullwhip_ratio for r in all_results),
-        mean_wip=mean(r.mean_wip for r in all_results),
+        mean_lead_time=math.fsum(mean_lt) / n,
+        lead_time_std=math.fsum(std_lt) / n,
+        worst_case_lead_time_p95=math.fsum(p95_lt) / n,
+        mean_backlog_t1=math.fsum(mean_backlog) / n,
+        max_backlog_t1=max(max_backlog),
+        bullwhip_ratio=math.fsum(bullwhip) / n,
+        mean_wip=math.fsum(mean_wip) / n,
         daily_oem_demand=base.daily_oem_demand,
         oem_to_t1_orders=base.oem_to_t1_orders,
         t1_to_t23_orders=base.t1_to_t23_orders,
@@ -402,9 +485,100 @@ def run_forecast_sharing(config: SimulationConfig) -> SimulationResults:
     return run_scenario(config, 2)
 
 
-def compare_scenarios(config: SimulationConfig) -> ScenarioComparison:
-    return ScenarioComparison(baseline=run_scenario(config, 1), forecast_sharing=run_scenario(config, 2))
+# Config fields only the forecast and visibility scenarios read. The baseline
+# result does not depend on them, so they are left out of its memo key.
+_BASELINE_IGNORED_FIELDS = frozenset({"oem_forecast_horizon", "beta_f", "alpha_inv", "oem_inventory_target"})
+_BASELINE_FIELDS: Tuple[str, ...] = tuple(
+    f.name for f in fields(SimulationConfig) if f.name not in _BASELINE_IGNORED_FIELDS
+)
+
+
+@lru_cache(maxsize=16)
+def _run_baseline_cached(key: Tuple) -> SimulationResults:
+    values = dict(zip(_BASELINE_FIELDS, key))
+    values["demand_params"] = dict(values["demand_params"])
+    return run_scenario(SimulationConfig(**values), 1)
 
 
-def run_all_scenarios(config: SimulationConfig) -> Dict[int, SimulationResults]:
-    return {scenario_id: run_scenario(config, scenario_id) for scenario_id in [1, 2, 3, 4, 5]}
+def _copy_results(result: SimulationResults) -> SimulationResults:
+    # A copy of every list and order record, so callers never share state
+    # with the memoized result.
+    copies = {f.name: list(getattr(result, f.name)) for f in fields(result) if isinstance(getattr(result, f.name), list)}
+    copies["order_log"] = [replace(entry) for entry in result.order_log]
+    return replace(result, **copies)
+
+
+def compare_scenarios(config: SimulationConfig) -> ScenarioComparison:
+    """Run baseline and forecast sharing on the same config.
+
+    The baseline run is memoized on the fields it actually reads, so sweeping
+    forecast knobs such as ``beta_f`` reruns only the forecast scenario. Each
+    call gets its own copy of the memoized baseline result.
+    """
+    key = tuple(value for f, value in zip(fields(config), config.cache_key()) if f.name not in _BASELINE_IGNORED_FIELDS)
+    return ScenarioComparison(baseline=_copy_results(_run_baseline_cached(key)), forecast_sharing=run_scenario(config, 2))
+
+
+def _run_one(config: SimulationConfig, scenario_id: int) -> Tuple[int, SimulationResults]:
+    # Module-level so it can be pickled into worker processes.
+    return scenario_id, run_scenario(config, scenario_id)
+
+
+def iter_scenario_results(
+    config: SimulationConfig,
+    scenario_ids: Iterable[int] = SCENARIO_IDS,
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[int, SimulationResults]]:
+    """Yield ``(scenario_id, results)`` pairs as each scenario finishes.
+
+    Scenarios are independent, so with ``max_workers > 1`` they are dispatched
+    to a process pool and yielded in completion order. Otherwise they run
+    serially in the given order.
+    """
+    scenario_ids = list(scenario_ids)
+    workers = min(max_workers or 1, len(scenario_ids))
+    if workers <= 1:
+        for scenario_id in scenario_ids:
+            yield _run_one(config, scenario_id)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_run_one, config, scenario_id) for scenario_id in scenario_ids]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_all_scenarios(config: SimulationConfig, max_workers: Optional[int] = None) -> Dict[int, SimulationResults]:
+    results = dict(iter_scenario_results(config, max_workers=max_workers))
+    return {scenario_id: results[scenario_id] for scenario_id in SCENARIO_IDS}
+
+
+def _run_seed(config: SimulationConfig, scenario_id: int, seed: int) -> SimulationResults:
+    # Module-level so it can be pickled into worker processes. Replication i
+    # runs on random_seed + i, so base seeds are spaced by the replication
+    # count to keep the streams of different sweep seeds disjoint.
+    return run_scenario(replace(config, random_seed=seed * config.replications_per_scenario), scenario_id)
+
+
+def run_many(
+    config: SimulationConfig,
+    seeds: Iterable[int],
+    scenario_id: int = 1,
+    max_workers: Optional[int] = None,
+) -> List[SimulationResults]:
+    """Run one scenario once per seed and return the results in seed order.
+
+    Each run uses ``config`` with ``random_seed`` replaced by
+    ``seed * replications_per_scenario`` (just the seed with one replication),
+    so no two seeds share a replication. Seeds are independent, so with
+    ``max_workers > 1`` they are spread over a process pool; otherwise they
+    run serially.
+    """
+    seeds = list(seeds)
+    workers = min(max_workers or 1, len(seeds))
+    if workers <= 1:
+        return [_run_seed(config, scenario_id, seed) for seed in seeds]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(seeds) // (workers * 4))
+        return list(executor.map(_run_seed, repeat(config), repeat(scenario_id), seeds, chunksize=chunksize))
@@ -1,5 +1,6 @@
 import unittest
 
+from sc_simulation.baseline import BaselineParams, simulate_baseline
 from supply_chain_simulation import SimulationConfig, run_baseline
 
 
@@ -12,5 +13,24 @@ class BaselineSimulationTests(unittest.TestCase):
         self.assertEqual(len(results.t1_backlog_units), 30)
 
 
+class ScBaselineTests(unittest.TestCase):
+    def test_simulate_baseline_is_seed_pinned(self):
+        results = simulate_baseline(BaselineParams(seed=7))
+        self.assertEqual(len(results.lead_times), 150)
+        self.assertEqual(sum(results.lead_times), 623)
+        self.assertEqual(results.max_lead_time, 8)
+        self.assertAlmostEqual(results.mean_lead_time, 4.153333333333333)
+        self.assertAlmostEqual(results.lead_time_std, 1.4223767277186292)
+        self.assertAlmostEqual(results.avg_wip, 213.3)
+        self.assertAlmostEqual(results.avg_backlog, 213.475)
+        self.assertAlmostEqual(results.otif, 0.12)
+
+    def test_simulate_baseline_handles_long_lead_times(self):
+        params = BaselineParams(days=40, t2_to_t1_lead_time_exp_mean=1e5, t1_to_oem_lead_time_uniform_max=1e4)
+        results = simulate_baseline(params)
+        self.assertGreaterEqual(min(results.lead_times), 1)
+        self.assertEqual(results.lead_times, simulate_baseline(params).lead_times)
+
+
 if __name__ == "__main__":
     unittest.main()
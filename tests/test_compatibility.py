@@ -10,6 +10,20 @@ class CompatibilityTests(unittest.TestCase):
         via_class = SupplyChainSimulation(cfg, scenario_id=1).run_simulation()
         self.assertAlmostEqual(direct.mean_lead_time, via_class.mean_lead_time)
 
+    def test_rng_starts_the_demand_stream(self):
+        cfg = SimulationConfig(simulation_horizon=25, random_seed=4, demand_distribution_type="normal", demand_params={"mean": 100.0, "std_dev": 10.0})
+        sim = SupplyChainSimulation(cfg, scenario_id=1, seed_offset=2)
+        rng = sim.rng
+        expected = [max(0, round(rng.gauss(100.0, 10.0))) for _ in range(25)]
+        self.assertEqual(sim.run_simulation().daily_oem_demand, expected)
+
+    def test_cache_key_tracks_config_fields(self):
+        cfg = SimulationConfig(simulation_horizon=25, demand_params={"lambda": 90.0})
+        same = SimulationConfig(simulation_horizon=25, demand_params={"lambda": 90.0})
+        other = SimulationConfig(simulation_horizon=25, demand_params={"lambda": 95.0})
+        self.assertEqual(hash(cfg.cache_key()), hash(same.cache_key()))
+        self.assertNotEqual(cfg.cache_key(), other.cache_key())
+
 
 if __name__ == "__main__":
     unittest.main()
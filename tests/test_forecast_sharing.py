@@ -1,6 +1,14 @@
+from dataclasses import replace
 import unittest
 
-from supply_chain_simulation import SimulationConfig, compare_scenarios, run_scenario
+from supply_chain_simulation import (
+    _BASELINE_IGNORED_FIELDS,
+    SimulationConfig,
+    compare_scenarios,
+    run_all_scenarios,
+    run_many,
+    run_scenario,
+)
 
 
 class ScenarioPolicyTests(unittest.TestCase):
@@ -17,6 +25,55 @@ class ScenarioPolicyTests(unittest.TestCase):
         self.assertEqual(cmp.baseline.scenario_name, "baseline")
         self.assertEqual(cmp.forecast_sharing.scenario_name, "forecast_sharing")
 
+    def test_compare_reuses_baseline_across_forecast_knobs(self):
+        config = SimulationConfig(simulation_horizon=30, random_seed=5)
+        first = compare_scenarios(config)
+        first.baseline.lead_times.sort(reverse=True)
+        first.baseline.order_log[0].qty = -1
+        swept = compare_scenarios(replace(config, beta_f=0.4))
+        fresh = run_scenario(config, 1)
+        self.assertIsNot(swept.baseline, first.baseline)
+        self.assertEqual(swept.baseline.lead_times, fresh.lead_times)
+        self.assertEqual(swept.baseline.order_log, fresh.order_log)
+        self.assertEqual(swept.forecast_sharing.t1_to_t23_orders, run_scenario(replace(config, beta_f=0.4), 2).t1_to_t23_orders)
+
+    def test_baseline_ignores_forecast_only_fields(self):
+        changed = {"oem_forecast_horizon": 3, "beta_f": 0.9, "alpha_inv": 0.9, "oem_inventory_target": 250.0}
+        self.assertEqual(set(changed), _BASELINE_IGNORED_FIELDS)
+        config = SimulationConfig(simulation_horizon=60, random_seed=8)
+        expected = run_scenario(config, 1)
+        for name, value in changed.items():
+            with self.subTest(field=name):
+                self.assertEqual(run_scenario(replace(config, **{name: value}), 1), expected)
+
+    def test_parallel_run_matches_serial(self):
+        config = SimulationConfig(simulation_horizon=30, random_seed=3)
+        serial = run_all_scenarios(config)
+        parallel = run_all_scenarios(config, max_workers=2)
+        self.assertEqual(list(parallel), [1, 2, 3, 4, 5])
+        for scenario in serial:
+            self.assertEqual(serial[scenario].lead_times, parallel[scenario].lead_times)
+            self.assertEqual(serial[scenario].t1_to_t23_orders, parallel[scenario].t1_to_t23_orders)
+
+    def test_run_many_matches_single_seed_runs(self):
+        config = SimulationConfig(simulation_horizon=30, random_seed=3)
+        seeds = [4, 9, 21]
+        results = run_many(config, seeds, scenario_id=2, max_workers=2)
+        self.assertEqual(len(results), len(seeds))
+        for seed, result in zip(seeds, results):
+            expected = run_scenario(replace(config, random_seed=seed), 2)
+            self.assertEqual(result.scenario_id, 2)
+            self.assertEqual(result.daily_oem_demand, expected.daily_oem_demand)
+            self.assertEqual(result.t1_to_t23_orders, expected.t1_to_t23_orders)
+
+    def test_run_many_seeds_do_not_share_replications(self):
+        config = SimulationConfig(simulation_horizon=30, random_seed=3, replications_per_scenario=3)
+        results = run_many(config, [1, 2], scenario_id=1)
+        for seed, result in zip([1, 2], results):
+            expected = run_scenario(replace(config, random_seed=seed * 3), 1)
+            self.assertEqual(result.mean_lead_time, expected.mean_lead_time)
+        self.assertNotEqual(results[0].daily_oem_demand, results[1].daily_oem_demand)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,50 @@
+import math
+import random
+from statistics import pvariance
+import unittest
+
+from supply_chain_simulation import _percentile_inclusive, _pop_variance
+
+
+def _sorted_percentile(values, percentile):
+    # Reference: linear interpolation between order statistics of a full sort.
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * percentile
+    low, high = math.floor(pos), math.ceil(pos)
+    return ordered[low] + (pos - low) * (ordered[high] - ordered[low])
+
+
+def _sample_series():
+    rng = random.Random(5)
+    yield [rng.randint(0, 40) for _ in range(257)]
+    yield [rng.randint(1, 3) for _ in range(100)]
+    yield [4] * 20
+    yield [9]
+    yield [2, 7]
+
+
+class PercentileTests(unittest.TestCase):
+    def test_matches_sorted_reference(self):
+        for values in _sample_series():
+            for percentile in (0.0, 0.5, 0.9, 0.95, 0.99, 1.0):
+                with self.subTest(n=len(values), percentile=percentile):
+                    self.assertAlmostEqual(
+                        _percentile_inclusive(values, percentile), _sorted_percentile(values, percentile)
+                    )
+
+    def test_empty_series_is_zero(self):
+        self.assertEqual(_percentile_inclusive([], 0.95), 0.0)
+
+
+class PopVarianceTests(unittest.TestCase):
+    def test_matches_statistics_pvariance(self):
+        for values in _sample_series():
+            with self.subTest(n=len(values)):
+                self.assertAlmostEqual(_pop_variance(values), pvariance(values))
+
+    def test_empty_series_is_zero(self):
+        self.assertEqual(_pop_variance([]), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
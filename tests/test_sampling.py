@@ -0,0 +1,63 @@
+import math
+import random
+from statistics import fmean, pvariance
+import unittest
+
+from supply_chain_simulation import _poisson_cdf, poisson_variate
+
+
+class _FixedDraw:
+    def __init__(self, u: float) -> None:
+        self.u = u
+
+    def random(self) -> float:
+        return self.u
+
+
+def _walk_inverse_cdf(lam: float, u: float) -> int:
+    # Reference: the linear inverse-CDF walk the cached table replaced.
+    k = 0
+    p = math.exp(-lam)
+    cdf = p
+    while u > cdf:
+        k += 1
+        p *= lam / k
+        cdf += p
+    return k
+
+
+class PoissonSamplerTests(unittest.TestCase):
+    def test_cached_table_matches_linear_walk(self):
+        for lam in [0.3, 3.7, 100.0, 480.0]:
+            for i in range(1, 1000):
+                u = i / 1000
+                self.assertEqual(poisson_variate(_FixedDraw(u), lam), _walk_inverse_cdf(lam, u), (lam, u))
+
+    def test_sample_mean_and_variance_match_lambda(self):
+        # 1200 exceeds _POISSON_MAX_LAMBDA, so it is drawn as two halves.
+        for lam in [100.0, 200.0, 1200.0]:
+            rng = random.Random(11)
+            draws = [poisson_variate(rng, lam) for _ in range(20000)]
+            self.assertAlmostEqual(fmean(draws), lam, delta=lam * 0.01)
+            self.assertAlmostEqual(pvariance(draws), lam, delta=lam * 0.05)
+
+    def test_non_positive_lambda_draws_zero(self):
+        rng = random.Random(3)
+        self.assertEqual([poisson_variate(rng, lam) for lam in (0.0, -5.0)], [0, 0])
+        self.assertEqual(rng.random(), random.Random(3).random())
+
+    def test_cdf_table_is_sorted_and_reaches_one(self):
+        for lam in [1e-300, 0.3, 1.0, 5.5, 100.0, 333.3, 500.0]:
+            table = _poisson_cdf(lam)
+            self.assertTrue(all(a <= b for a, b in zip(table, table[1:])), lam)
+            self.assertGreaterEqual(table[-1], 1.0)
+        self.assertLess(len(_poisson_cdf(1.0)), 30)
+
+    def test_largest_uniform_stays_in_the_tail(self):
+        top = _FixedDraw(1.0 - 2.0**-53)
+        self.assertLess(poisson_variate(top, 5.5), 40)
+        self.assertLess(poisson_variate(top, 500.0), 750)
+
+
+if __name__ == "__main__":
+    unittest.main()